@@ -1,27 +1,34 @@
+import time
+_IMPORT_STARTED = time.perf_counter()
+
 from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
-from typing import Tuple, Dict, Optional, List
+from typing import Tuple, Dict, Optional, List, Iterator, Iterable
 import re
 import os
+import sys
+import importlib
+import threading
+from collections import OrderedDict
 from werkzeug.utils import secure_filename
-import PyPDF2
-from docx import Document
-import requests
 import logging
 import io
-from flask import send_file
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
+import gzip
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+try:
+    import brotli  # optional: enables Content-Encoding: br
+except ImportError:
+    brotli = None
 
-# ReportLab imports for enhanced PDF
-from reportlab.lib import colors
+# Lightweight ReportLab modules; platypus, styles and colors are loaded lazily
+# in generate_pdf_summary. PyPDF2, python-docx and requests are loaded lazily too.
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import (
-    SimpleDocTemplate, Table, TableStyle, Paragraph, 
-    Spacer, Image as RLImage, PageBreak, HRFlowable
-)
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
 app = Flask(__name__)
@@ -32,6 +39,17 @@ UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'txt'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
+# Resume extraction limits (pass None to the extract_* functions to lift them)
+MAX_PDF_PAGES = 30
+MAX_DOCX_PARAGRAPHS = 5000
+MAX_EXTRACTED_CHARS = 200_000
+MAX_EXTRACTED_LINKS = 500
+TXT_CHUNK_SIZE = 64 * 1024
+
+# Parsed-resume cache keyed by a hash of the uploaded bytes
+RESUME_CACHE_TTL = int(os.getenv('RESUME_CACHE_TTL', '3600'))  # seconds
+RESUME_CACHE_MAX_ENTRIES = int(os.getenv('RESUME_CACHE_MAX_ENTRIES', '512'))
+
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
@@ -42,42 +60,143 @@ logger = logging.getLogger(__name__)
 
 GITHUB_API_TOKEN = os.getenv('GITHUB_API_TOKEN')
 GITHUB_API_BASE = 'https://api.github.com'
+GITHUB_GRAPHQL_URL = 'https://api.github.com/graphql'
+
+# Max pooled keep-alive connections to GitHub per worker process
+GITHUB_POOL_SIZE = int(os.getenv('GITHUB_POOL_SIZE', '20'))
+
+# Profile sections, in the order the pipeline produces them
+PROFILE_SECTIONS = ('user', 'repositories', 'contribution_activity', 'language_distribution')
+MAX_REPOSITORIES = 100
+
+# HTTP caching / compression
+CACHE_MAX_AGE = int(os.getenv('CACHE_MAX_AGE', '300'))
+CACHE_STALE_WHILE_REVALIDATE = int(os.getenv('CACHE_STALE_WHILE_REVALIDATE', '600'))
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+
+# Multi-user comparison
+COMPARE_MAX_USERS = 10
+COMPARE_BATCH_SIZE = 5  # users per combined GraphQL query
+COMPARE_WORKERS = 8  # shared pool for REST fallback fetches and the language fan-out
+COMPARE_LANGUAGE_BUDGET = int(os.getenv('COMPARE_LANGUAGE_BUDGET', '200'))  # REST /languages calls per comparison
+
+# Encodings for contribution_activity.days (see encode_contribution_days)
+DAYS_FORMATS = ('list', 'dense', 'rle')
+
+# Heavy dependencies loaded on first use (see lazy_import / warm_up_dependencies)
+HEAVY_DEPENDENCIES = ('requests', 'PyPDF2', 'docx', 'reportlab.platypus', 'pdf_export')
+
+# Startup-time measurements, exposed via /api/health/startup
+STARTUP_TIMINGS: Dict[str, object] = {'dependency_load_ms': {}}
 
 # ==================== Utility Functions ====================
 
+def lazy_import(module_name: str):
+    """Import a heavy dependency on first use and record how long it took"""
+    # Always go through import_module: a module that another thread is still
+    # importing is already in sys.modules, and only the import lock waits for it
+    already_loaded = module_name in sys.modules
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    if not already_loaded:
+        STARTUP_TIMINGS['dependency_load_ms'].setdefault(module_name, round((time.perf_counter() - started) * 1000, 1))
+    return module
+
+def warm_up_dependencies() -> Dict[str, float]:
+    """
+    Preload every heavy dependency, e.g. from a gunicorn post_fork hook, so the
+    first real request does not pay the import cost. Returns per-module load times.
+    """
+    started = time.perf_counter()
+    for module_name in HEAVY_DEPENDENCIES:
+        lazy_import(module_name)
+    STARTUP_TIMINGS['warm_up_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    return STARTUP_TIMINGS['dependency_load_ms']
+
+
+_github_session = None
+_github_session_pid = None
+_github_session_lock = threading.Lock()
+
+def github_session():
+    """
+    Pooled HTTP session for GitHub calls, one per process. It is created lazily and
+    re-created when the PID changes, so pre-fork servers never share sockets
+    between workers.
+    """
+    global _github_session, _github_session_pid
+    if _github_session is not None and _github_session_pid == os.getpid():
+        return _github_session
+    with _github_session_lock:
+        if _github_session is None or _github_session_pid != os.getpid():
+            requests = lazy_import('requests')
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=GITHUB_POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _github_session = session
+            _github_session_pid = os.getpid()
+    return _github_session
+
+def reset_github_session() -> None:
+    """Drop the current process's GitHub session (called after fork by gunicorn)"""
+    global _github_session, _github_session_pid
+    with _github_session_lock:
+        if _github_session is not None and _github_session_pid == os.getpid():
+            _github_session.close()
+        _github_session = None
+        _github_session_pid = None
+
 def allowed_file(filename: str) -> bool:
     """Check if file extension is allowed"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from PDF file"""
-    text = ""
+def join_bounded(chunks: Iterable[str], max_chars: Optional[int] = MAX_EXTRACTED_CHARS) -> str:
+    """
+    Join chunks one per line in linear time, stopping once `max_chars` characters
+    have been collected. `chunks` is consumed lazily, so remaining pages or
+    paragraphs are never extracted.
+    """
+    parts: List[str] = []
+    size = 0
+    for chunk in chunks:
+        piece = chunk + "\n"
+        if max_chars is not None and size + len(piece) >= max_chars:
+            parts.append(piece[:max_chars - size])
+            break
+        parts.append(piece)
+        size += len(piece)
+    return "".join(parts)
+
+def extract_text_from_pdf(file_path: str, max_pages: Optional[int] = MAX_PDF_PAGES,
+                          max_chars: Optional[int] = MAX_EXTRACTED_CHARS) -> str:
+    """Extract text from the first `max_pages` pages of a PDF file"""
+    PyPDF2 = lazy_import('PyPDF2')
     try:
         with open(file_path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
-            for page in reader.pages:
-                page_text = page.extract_text() or ""
-                text += page_text + "\n"
+            pages = islice(reader.pages, max_pages)
+            return join_bounded((page.extract_text() or "" for page in pages), max_chars)
     except Exception as e:
         logger.error(f"Error extracting PDF: {e}")
         raise ValueError("Failed to extract text from PDF")
-    return text
 
-def extract_text_and_links_from_pdf(file_path: str) -> Tuple[str, List[str]]:
-    """Extract text and link annotations (URIs) from a PDF"""
-    text = ""
+def extract_text_and_links_from_pdf(file_path: str, max_pages: Optional[int] = MAX_PDF_PAGES,
+                                    max_chars: Optional[int] = MAX_EXTRACTED_CHARS) -> Tuple[str, List[str]]:
+    """Extract text and link annotations (URIs) from the first `max_pages` pages of a PDF"""
+    PyPDF2 = lazy_import('PyPDF2')
     links: List[str] = []
-    try:
-        reader = PyPDF2.PdfReader(file_path)
-        for page in reader.pages:
-            page_text = page.extract_text() or ""
-            text += page_text + "\n"
+
+    def page_texts(reader) -> Iterator[str]:
+        for page in islice(reader.pages, max_pages):
             try:
                 annots = page.get("/Annots")
             except Exception:
                 annots = None
             if annots:
                 for annot in annots:
+                    if len(links) >= MAX_EXTRACTED_LINKS:
+                        break
                     try:
                         obj = annot.get_object()
                         a = obj.get("/A") if obj else None
@@ -87,33 +206,41 @@ def extract_text_and_links_from_pdf(file_path: str) -> Tuple[str, List[str]]:
                                 links.append(uri)
                     except Exception:
                         continue
+            yield page.extract_text() or ""
+
+    try:
+        reader = PyPDF2.PdfReader(file_path)
+        text = join_bounded(page_texts(reader), max_chars)
     except Exception as e:
         logger.error(f"Error extracting PDF (text+links): {e}")
         raise ValueError("Failed to extract text/links from PDF")
     return text, links
 
-def extract_text_from_docx(file_path: str) -> str:
-    """Extract text from DOCX file"""
-    text = ""
+def extract_text_from_docx(file_path: str, max_paragraphs: Optional[int] = MAX_DOCX_PARAGRAPHS,
+                           max_chars: Optional[int] = MAX_EXTRACTED_CHARS) -> str:
+    """Extract text from the first `max_paragraphs` paragraphs of a DOCX file"""
+    Document = lazy_import('docx').Document
     try:
         doc = Document(file_path)
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
+        paragraphs = islice(doc.paragraphs, max_paragraphs)
+        return join_bounded((paragraph.text for paragraph in paragraphs), max_chars)
     except Exception as e:
         logger.error(f"Error extracting DOCX: {e}")
         raise ValueError("Failed to extract text from DOCX")
-    return text
 
-def extract_text_and_links_from_docx(file_path: str) -> Tuple[str, List[str]]:
+def extract_text_and_links_from_docx(file_path: str, max_paragraphs: Optional[int] = MAX_DOCX_PARAGRAPHS,
+                                     max_chars: Optional[int] = MAX_EXTRACTED_CHARS) -> Tuple[str, List[str]]:
     """Extract text and external hyperlinks from DOCX"""
-    text = ""
+    Document = lazy_import('docx').Document
     links: List[str] = []
     try:
         doc = Document(file_path)
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
+        paragraphs = islice(doc.paragraphs, max_paragraphs)
+        text = join_bounded((paragraph.text for paragraph in paragraphs), max_chars)
         try:
             for rel in doc.part.rels.values():
+                if len(links) >= MAX_EXTRACTED_LINKS:
+                    break
                 if rel.reltype and 'hyperlink' in rel.reltype:
                     target = getattr(rel, 'target_ref', None)
                     if target:
@@ -125,15 +252,61 @@ def extract_text_and_links_from_docx(file_path: str) -> Tuple[str, List[str]]:
         raise ValueError("Failed to extract text/links from DOCX")
     return text, links
 
-def extract_text_from_txt(file_path: str) -> str:
-    """Extract text from plain text file"""
+def extract_text_from_txt(file_path: str, max_chars: Optional[int] = MAX_EXTRACTED_CHARS) -> str:
+    """Extract up to `max_chars` characters from a plain text file, reading it in chunks"""
     try:
+        parts: List[str] = []
+        remaining = max_chars
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            return f.read()
+            while remaining is None or remaining > 0:
+                chunk = f.read(TXT_CHUNK_SIZE if remaining is None else min(TXT_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                parts.append(chunk)
+                if remaining is not None:
+                    remaining -= len(chunk)
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error extracting TXT: {e}")
         raise ValueError("Failed to extract text from TXT")
 
+_resume_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+_resume_cache_lock = threading.Lock()
+
+def resume_cache_key(file_ext: str, stream) -> str:
+    """
+    Cache key for an uploaded resume: its type plus a SHA-256 of its bytes.
+    Reads `stream` in TXT_CHUNK_SIZE chunks and rewinds it afterwards.
+    """
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(TXT_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    stream.seek(0)
+    return f"{file_ext}:{digest.hexdigest()}"
+
+def resume_cache_get(key: str) -> Optional[Dict]:
+    """Return the cached parse result for `key` if present and not expired"""
+    with _resume_cache_lock:
+        entry = _resume_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > RESUME_CACHE_TTL:
+            del _resume_cache[key]
+            return None
+        _resume_cache.move_to_end(key)
+        return result
+
+def resume_cache_put(key: str, result: Dict) -> None:
+    """Store a parse result, evicting the least recently used entries beyond RESUME_CACHE_MAX_ENTRIES"""
+    if RESUME_CACHE_MAX_ENTRIES <= 0:
+        return
+    with _resume_cache_lock:
+        _resume_cache[key] = (time.monotonic(), result)
+        _resume_cache.move_to_end(key)
+        while len(_resume_cache) > RESUME_CACHE_MAX_ENTRIES:
+            _resume_cache.popitem(last=False)
+
 def extract_github_username(text: str, urls: Optional[List[str]] = None) -> Optional[str]:
     """Extract GitHub username/profile from text or provided URLs"""
     if not text and not urls:
@@ -167,11 +340,14 @@ def extract_github_username(text: str, urls: Optional[List[str]] = None) -> Opti
 
     return None
 
+class GitHubUserNotFound(ValueError):
+    """GitHub reports that the user (or organization) does not exist"""
+
 def validate_github_username(username: str) -> bool:
     """Validate if GitHub username exists"""
     try:
         headers = {'Authorization': f'token {GITHUB_API_TOKEN}'} if GITHUB_API_TOKEN else {}
-        response = requests.get(f'{GITHUB_API_BASE}/users/{username}', headers=headers, timeout=5)
+        response = github_session().get(f'{GITHUB_API_BASE}/users/{username}', headers=headers, timeout=5)
         return response.status_code == 200
     except Exception as e:
         logger.error(f"Error validating GitHub username: {e}")
@@ -181,10 +357,12 @@ def fetch_github_user_data(username: str) -> Dict:
     """Fetch user data from GitHub API"""
     try:
         headers = {'Authorization': f'token {GITHUB_API_TOKEN}'} if GITHUB_API_TOKEN else {}
-        response = requests.get(f'{GITHUB_API_BASE}/users/{username}', headers=headers, timeout=5)
+        response = github_session().get(f'{GITHUB_API_BASE}/users/{username}', headers=headers, timeout=5)
         
+        if response.status_code == 404:
+            raise GitHubUserNotFound(f"GitHub user not found: {username}")
         if response.status_code != 200:
-            raise ValueError(f"GitHub user not found: {username}")
+            raise RuntimeError(f"GitHub user lookup for {username} failed with {response.status_code}")
         
         user_data = response.json()
         return {
@@ -200,53 +378,149 @@ def fetch_github_user_data(username: str) -> Dict:
         logger.error(f"Error fetching GitHub user data: {e}")
         raise
 
-def fetch_github_repositories(username: str) -> list:
-    """Fetch repositories from GitHub API"""
+def record_fallback(errors: Optional[List[str]], message: str) -> None:
+    """
+    Note that a pipeline stage served fallback data because a GitHub call failed,
+    so the response is not cached as if it were complete
+    """
+    if errors is not None:
+        errors.append(message)
+
+GITHUB_REPOSITORIES_QUERY = """
+query($login: String!, $first: Int!) {
+  repositoryOwner(login: $login) {
+    repositories(first: $first, privacy: PUBLIC, ownerAffiliations: OWNER, isFork: false,
+                 orderBy: {field: STARGAZERS, direction: DESC}) {
+      nodes { name description url stargazerCount forkCount primaryLanguage { name } }
+    }
+  }
+}
+"""
+
+def repository_from_rest(repo: Dict) -> Dict:
+    """Map a REST repository object onto the API's repository shape"""
+    return {
+        'name': repo.get('name'),
+        'description': repo.get('description'),
+        'url': repo.get('html_url'),
+        'stars': repo.get('stargazers_count', 0),
+        'forks': repo.get('forks_count', 0),
+        'language': repo.get('language'),
+    }
+
+def repository_from_graphql(node: Dict) -> Dict:
+    """Map a GraphQL repository node onto the API's repository shape"""
+    return {
+        'name': node.get('name'),
+        'description': node.get('description'),
+        'url': node.get('url'),
+        'stars': node.get('stargazerCount', 0),
+        'forks': node.get('forkCount', 0),
+        'language': (node.get('primaryLanguage') or {}).get('name'),
+    }
+
+def fetch_github_repositories_graphql(username: str, limit: int) -> Optional[List[Dict]]:
+    """
+    Most-starred public non-fork repositories via GraphQL, in one request.
+    Returns None when GraphQL is unavailable; raises GitHubUserNotFound if the user does not exist.
+    """
+    if not GITHUB_API_TOKEN:
+        return None
+
+    headers = {'Authorization': f'bearer {GITHUB_API_TOKEN}', 'Content-Type': 'application/json'}
+    variables = {'login': username, 'first': limit}
     try:
-        headers = {'Authorization': f'token {GITHUB_API_TOKEN}'} if GITHUB_API_TOKEN else {}
-        
-        repositories = []
-        page = 1
-        per_page = 100
-        
-        while len(repositories) < 100:
-            response = requests.get(
-                f'{GITHUB_API_BASE}/users/{username}/repos',
-                params={'page': page, 'per_page': per_page, 'sort': 'stars'},
-                headers=headers,
-                timeout=5
-            )
-            
-            if response.status_code != 200:
-                break
-            
-            repos = response.json()
-            if not repos:
-                break
-            
-            for repo in repos:
-                if not repo.get('fork'):
-                    repositories.append({
-                        'name': repo.get('name'),
-                        'description': repo.get('description'),
-                        'url': repo.get('html_url'),
-                        'stars': repo.get('stargazers_count', 0),
-                        'forks': repo.get('forks_count', 0),
-                        'language': repo.get('language'),
-                    })
-            
-            page += 1
-        
-        return sorted(repositories, key=lambda x: x['stars'], reverse=True)
+        resp = github_session().post(GITHUB_GRAPHQL_URL, json={"query": GITHUB_REPOSITORIES_QUERY, "variables": variables},
+                                     headers=headers, timeout=10)
+        if resp.status_code != 200:
+            logger.warning(f"GraphQL repositories fetch failed {resp.status_code}: {resp.text}")
+            return None
+        data = resp.json().get("data")
+    except Exception as e:
+        logger.warning(f"GraphQL repositories fetch failed: {e}")
+        return None
+    if not data:
+        return None
+
+    owner = data.get("repositoryOwner")
+    if owner is None:
+        raise GitHubUserNotFound(f"GitHub user not found: {username}")
+    return [repository_from_graphql(node) for node in (owner.get("repositories") or {}).get("nodes") or []]
+
+def fetch_github_repositories_search(username: str, limit: int, errors: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Most-starred non-fork repositories via the REST search API, in one request
+    (search excludes forks by default). Raises GitHubUserNotFound if the user does not exist.
+    """
+    headers = {'Authorization': f'token {GITHUB_API_TOKEN}'} if GITHUB_API_TOKEN else {}
+    response = github_session().get(
+        f'{GITHUB_API_BASE}/search/repositories',
+        params={'q': f'user:{username}', 'sort': 'stars', 'order': 'desc', 'per_page': limit},
+        headers=headers,
+        timeout=5
+    )
+
+    # Search answers 422 when the `user:` qualifier names an unknown account
+    if response.status_code == 422:
+        raise GitHubUserNotFound(f"GitHub user not found: {username}")
+    if response.status_code != 200:
+        logger.warning(f"Repository search failed {response.status_code}: {response.text}")
+        record_fallback(errors, f"repositories: search returned {response.status_code}")
+        return []
+
+    return [repository_from_rest(repo) for repo in response.json().get('items', [])]
+
+def fetch_github_repositories(username: str, limit: int = MAX_REPOSITORIES, errors: Optional[List[str]] = None) -> list:
+    """
+    Fetch the `limit` most-starred non-fork repositories, using GraphQL when a token
+    is configured and the search API otherwise. Raises GitHubUserNotFound if the user does not exist.
+    """
+    if limit <= 0:
+        return []
+    try:
+        repositories = fetch_github_repositories_graphql(username, limit)
+        if repositories is None:
+            repositories = fetch_github_repositories_search(username, limit, errors=errors)
+    except GitHubUserNotFound:
+        raise
     except Exception as e:
         logger.error(f"Error fetching repositories: {e}")
+        record_fallback(errors, f"repositories: {e}")
         return []
 
+    return sorted(repositories, key=lambda x: x['stars'], reverse=True)[:limit]
+
+def fetch_avatar_bytes(avatar_url: Optional[str]) -> Optional[bytes]:
+    """Download an avatar image for the PDF export, or None if unavailable"""
+    if not avatar_url:
+        return None
+    try:
+        response = github_session().get(avatar_url, timeout=5)
+        if response.status_code == 200:
+            return response.content
+    except Exception as e:
+        logger.debug(f"Could not fetch avatar: {e}")
+    return None
+
 def generate_pdf_summary(user: Dict, repositories: List[Dict], contribution_activity: Dict, language_distribution: List[Dict]) -> bytes:
     """
     Generate a comprehensive PDF summary matching the dashboard layout.
     Includes profile, stats, contributions, language distribution, and detailed repository information.
     """
+    lazy_import('reportlab.platypus')
+    pdf_export = lazy_import('pdf_export')
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import (
+        SimpleDocTemplate, Table, TableStyle, Paragraph,
+        Spacer, Image as RLImage, PageBreak, HRFlowable, KeepTogether
+    )
+
+    # Fetch the avatar in the background while the rest of the document is assembled
+    avatar_pool = ThreadPoolExecutor(max_workers=1)
+    avatar_future = avatar_pool.submit(fetch_avatar_bytes, user.get('avatar_url'))
+    avatar_pool.shutdown(wait=False)
+
     buffer = io.BytesIO()
     
     doc = SimpleDocTemplate(
@@ -292,15 +566,6 @@ def generate_pdf_summary(user: Dict, repositories: List[Dict], contribution_acti
         fontName='Helvetica-Bold'
     )
     
-    repo_name_style = ParagraphStyle(
-        'RepoName',
-        parent=styles['Heading3'],
-        fontSize=12,
-        textColor=colors.HexColor('#4f46e5'),
-        spaceAfter=6,
-        fontName='Helvetica-Bold'
-    )
-    
     body_style = ParagraphStyle(
         'CustomBody',
         parent=styles['Normal'],
@@ -318,14 +583,6 @@ def generate_pdf_summary(user: Dict, repositories: List[Dict], contribution_acti
         spaceAfter=4
     )
     
-    url_style = ParagraphStyle(
-        'URLText',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.HexColor('#4f46e5'),
-        spaceAfter=8
-    )
-    
     stat_value_style = ParagraphStyle(
         'StatValue',
         parent=styles['Normal'],
@@ -357,17 +614,10 @@ def generate_pdf_summary(user: Dict, repositories: List[Dict], contribution_acti
     
     # ==================== USER PROFILE SECTION ====================
     
-    # Try to fetch avatar
-    avatar_img = None
-    if user.get('avatar_url'):
-        try:
-            response = requests.get(user['avatar_url'], timeout=5)
-            if response.status_code == 200:
-                img_buffer = io.BytesIO(response.content)
-                avatar_img = RLImage(img_buffer, width=1*inch, height=1*inch)
-        except Exception as e:
-            logger.debug(f"Could not fetch avatar: {e}")
-    
+    # The bordered table is added once the avatar download finishes (see end of function)
+    profile_index = len(elements)
+    profile_elements = []
+
     # Profile section with border
     profile_data = []
     
@@ -383,36 +633,6 @@ def generate_pdf_summary(user: Dict, repositories: List[Dict], contribution_acti
         profile_data.append([Spacer(1, 0.1*inch)])
         profile_data.append([Paragraph(user['bio'], body_style)])
     
-    # Create profile layout table
-    if avatar_img:
-        profile_table_data = [[avatar_img, profile_data]]
-        profile_table = Table(profile_table_data, colWidths=[1.3*inch, 5.2*inch])
-        profile_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 15),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f8fafc')),
-            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1')),
-            ('ROUNDEDCORNERS', [10, 10, 10, 10]),
-        ]))
-        elements.append(profile_table)
-    else:
-        profile_content_table = Table(profile_data, colWidths=[6.5*inch])
-        profile_content_table.setStyle(TableStyle([
-            ('LEFTPADDING', (0, 0), (-1, -1), 15),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 15),
-            ('TOPPADDING', (0, 0), (-1, -1), 15),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f8fafc')),
-            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1')),
-            ('ROUNDEDCORNERS', [10, 10, 10, 10]),
-        ]))
-        elements.append(profile_content_table)
-    
-    elements.append(Spacer(1, 0.3 * inch))
-    
     # ==================== PROFILE STATISTICS ====================
     stats_heading = Paragraph("Profile Statistics", heading_style)
     elements.append(stats_heading)
@@ -480,46 +700,23 @@ def generate_pdf_summary(user: Dict, repositories: List[Dict], contribution_acti
     ]))
     
     elements.append(contrib_table)
+    
+    heatmap = pdf_export.heatmap_for_days(contribution_activity.get('days') or [])
+    if heatmap is not None:
+        elements.append(Spacer(1, 0.15 * inch))
+        elements.append(heatmap)
     elements.append(Spacer(1, 0.3 * inch))
     
     # ==================== LANGUAGE DISTRIBUTION ====================
     if language_distribution and len(language_distribution) > 0:
         lang_heading = Paragraph("Language Distribution", heading_style)
-        elements.append(lang_heading)
-        
-        # Top 10 languages
-        top_languages = language_distribution[:10]
-        
-        lang_rows = []
-        for lang_stat in top_languages:
-            lang_name = lang_stat.get('language', 'Unknown')
-            percentage = lang_stat.get('percentage', 0)
-            
-            # Create a visual bar representation
-            bar_width = percentage / 100.0 * 4.5  # Scale to fit in inches
-            
-            lang_row = [
-                Paragraph(f"<b>{lang_name}</b>", body_style),
-                Paragraph(f"{percentage}%", meta_style)
-            ]
-            lang_rows.append(lang_row)
         
-        if lang_rows:
-            lang_table = Table(lang_rows, colWidths=[4.5*inch, 2*inch])
-            lang_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('LEFTPADDING', (0, 0), (-1, -1), 12),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-                ('LINEBELOW', (0, 0), (-1, -2), 0.5, colors.HexColor('#e2e8f0')),
-                ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1')),
-                ('ROUNDEDCORNERS', [10, 10, 10, 10]),
-            ]))
-            elements.append(lang_table)
+        # Top 10 languages as a bar chart (layout is cached by data, so repeat exports reuse it)
+        top_languages = tuple(
+            (lang_stat.get('language', 'Unknown'), lang_stat.get('percentage', 0))
+            for lang_stat in language_distribution[:10]
+        )
+        elements.append(KeepTogether([lang_heading, pdf_export.LanguageBarChart(top_languages)]))
         
         elements.append(Spacer(1, 0.4 * inch))
     
@@ -545,42 +742,9 @@ def generate_pdf_summary(user: Dict, repositories: List[Dict], contribution_acti
         elements.append(summary)
         elements.append(HRFlowable(width="100%", thickness=1, color=colors.HexColor('#e2e8f0'), spaceBefore=10, spaceAfter=15))
         
-        # Individual repositories
+        # Individual repositories (laid out up front; see pdf_export.RepositoryBlock)
         for idx, repo in enumerate(repositories, 1):
-            # Repository name
-            repo_name = Paragraph(
-                f"<b>{idx}. {repo.get('name', 'Unnamed')}</b>",
-                repo_name_style
-            )
-            elements.append(repo_name)
-            
-            # Metadata
-            language = repo.get('language') or 'N/A'
-            stars = repo.get('stars', 0)
-            forks = repo.get('forks', 0)
-            
-            metadata_text = f"⭐ {stars} stars  •  🔱 {forks} forks  •  💻 {language}"
-            metadata = Paragraph(metadata_text, meta_style)
-            elements.append(metadata)
-            
-            # Description
-            if repo.get('description'):
-                desc = Paragraph(repo['description'], body_style)
-                elements.append(desc)
-            else:
-                elements.append(Paragraph("<i>No description available</i>", meta_style))
-            
-            # URL
-            if repo.get('url'):
-                url_para = Paragraph(
-                    f"<link href='{repo['url']}'><u>{repo['url']}</u></link>",
-                    url_style
-                )
-                elements.append(url_para)
-            
-            # Separator
-            if idx < len(repositories):
-                elements.append(HRFlowable(width="100%", thickness=0.5, color=colors.HexColor('#e2e8f0'), spaceBefore=8, spaceAfter=8))
+            elements.append(pdf_export.RepositoryBlock(idx, repo, separator=idx < len(repositories), width=doc.width))
             
             # Page break every 6 repos
             if idx % 6 == 0 and idx < len(repositories):
@@ -600,19 +764,84 @@ def generate_pdf_summary(user: Dict, repositories: List[Dict], contribution_acti
     )
     elements.append(footer_text)
     
+    # ==================== USER PROFILE SECTION (deferred) ====================
+    avatar_img = None
+    avatar_bytes = avatar_future.result()
+    if avatar_bytes:
+        avatar_img = RLImage(io.BytesIO(avatar_bytes), width=1*inch, height=1*inch)
+    
+    # Create profile layout table
+    if avatar_img:
+        profile_table_data = [[avatar_img, profile_data]]
+        profile_table = Table(profile_table_data, colWidths=[1.3*inch, 5.2*inch])
+        profile_table.setStyle(TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 10),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+            ('TOPPADDING', (0, 0), (-1, -1), 15),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
+            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f8fafc')),
+            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1')),
+            ('ROUNDEDCORNERS', [10, 10, 10, 10]),
+        ]))
+        profile_elements.append(profile_table)
+    else:
+        profile_content_table = Table(profile_data, colWidths=[6.5*inch])
+        profile_content_table.setStyle(TableStyle([
+            ('LEFTPADDING', (0, 0), (-1, -1), 15),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 15),
+            ('TOPPADDING', (0, 0), (-1, -1), 15),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 15),
+            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f8fafc')),
+            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#cbd5e1')),
+            ('ROUNDEDCORNERS', [10, 10, 10, 10]),
+        ]))
+        profile_elements.append(profile_content_table)
+    
+    profile_elements.append(Spacer(1, 0.3 * inch))
+    
+    elements[profile_index:profile_index] = profile_elements
+    
     # Build PDF
     doc.build(elements)
     
     buffer.seek(0)
     return buffer.read()
 
-def fetch_github_contributions(username: str) -> Dict:
+def summarize_contribution_days(days: List[Dict], total: int) -> Dict:
+    """Compute current and longest streaks from a list of {date, count} days"""
+    # Compute longest streak and current streak
+    longest = 0
+    current = 0
+    temp = 0
+    # ensure days sorted by date
+    days_sorted = sorted(days, key=lambda x: x["date"])
+    for day in days_sorted:
+        if day["count"] > 0:
+            temp += 1
+        else:
+            if temp > longest:
+                longest = temp
+            temp = 0
+    if temp > longest:
+        longest = temp
+
+    # current streak: count from last day backwards while count>0
+    current = 0
+    for day in reversed(days_sorted):
+        if day["count"] > 0:
+            current += 1
+        else:
+            break
+
+    return {"total": int(total), "current_streak": int(current), "longest_streak": int(longest), "days": days_sorted}
+
+def fetch_github_contributions(username: str, errors: Optional[List[str]] = None) -> Dict:
     """Fetch contribution calendar via GitHub GraphQL and compute total, current streak and longest streak."""
     if not GITHUB_API_TOKEN:
         logger.warning("GITHUB_API_TOKEN not set: contribution stats may be unavailable")
         return {"total": 0, "current_streak": 0, "longest_streak": 0, "days": []}
 
-    graphql_url = "https://api.github.com/graphql"
     query = """
     query($login:String!) {
       user(login: $login) {
@@ -632,14 +861,22 @@ def fetch_github_contributions(username: str) -> Dict:
     """
     try:
         headers = {'Authorization': f'bearer {GITHUB_API_TOKEN}', 'Content-Type': 'application/json'}
-        resp = requests.post(graphql_url, json={"query": query, "variables": {"login": username}}, headers=headers, timeout=10)
+        resp = github_session().post(GITHUB_GRAPHQL_URL, json={"query": query, "variables": {"login": username}}, headers=headers, timeout=10)
         if resp.status_code != 200:
             logger.warning(f"GraphQL contributions fetch failed {resp.status_code}: {resp.text}")
+            record_fallback(errors, f"contribution_activity: GraphQL returned {resp.status_code}")
+            return {"total": 0, "current_streak": 0, "longest_streak": 0, "days": []}
+
+        data = resp.json().get("data")
+        if not data:
+            logger.warning(f"GraphQL contributions fetch failed: {resp.text}")
+            record_fallback(errors, "contribution_activity: GraphQL returned no data")
             return {"total": 0, "current_streak": 0, "longest_streak": 0, "days": []}
 
-        data = resp.json()
-        weeks = data.get("data", {}).get("user", {}).get("contributionsCollection", {}).get("contributionCalendar", {}).get("weeks", [])
-        total = data.get("data", {}).get("user", {}).get("contributionsCollection", {}).get("contributionCalendar", {}).get("totalContributions", 0)
+        # `user` is null for organizations, which have no contribution calendar
+        calendar = ((data.get("user") or {}).get("contributionsCollection") or {}).get("contributionCalendar") or {}
+        weeks = calendar.get("weeks", [])
+        total = calendar.get("totalContributions", 0)
 
         # Flatten days in chronological order
         days = []
@@ -647,37 +884,92 @@ def fetch_github_contributions(username: str) -> Dict:
             for d in w.get("contributionDays", []):
                 days.append({"date": d.get("date"), "count": d.get("contributionCount", 0)})
 
-        # Compute longest streak and current streak
-        longest = 0
-        current = 0
-        temp = 0
-        # ensure days sorted by date
-        days_sorted = sorted(days, key=lambda x: x["date"])
-        for idx, day in enumerate(days_sorted):
-            if day["count"] > 0:
-                temp += 1
-            else:
-                if temp > longest:
-                    longest = temp
-                temp = 0
-        if temp > longest:
-            longest = temp
-
-        # current streak: count from last day backwards while count>0
-        current = 0
-        for day in reversed(days_sorted):
-            if day["count"] > 0:
-                current += 1
-            else:
-                break
-
-        return {"total": int(total), "current_streak": int(current), "longest_streak": int(longest), "days": days_sorted}
+        return summarize_contribution_days(days, total)
     except Exception as e:
         logger.error(f"Error fetching contributions for {username}: {e}")
+        record_fallback(errors, f"contribution_activity: {e}")
         return {"total": 0, "current_streak": 0, "longest_streak": 0, "days": []}
 
 
-def aggregate_language_distribution(username: str, repositories: List[Dict]) -> List[Dict]:
+def encode_contribution_days(days: List[Dict], fmt: str = 'list'):
+    """
+    Encode the chronological `days` list in a compact form.
+
+    - list:  [{"date": "YYYY-MM-DD", "count": n}, ...] (unchanged)
+    - dense: {"format": "dense", "start": "YYYY-MM-DD", "counts": [n0, n1, ...]}
+             where counts[i] is the count for start + i days (gaps are filled with 0)
+    - rle:   {"format": "rle", "start": "YYYY-MM-DD", "runs": [[count, length], ...]}
+             run-length encoding of the dense counts
+    """
+    if fmt == 'list':
+        return days
+    if not days:
+        return {"format": fmt, "start": None, "runs" if fmt == 'rle' else "counts": []}
+
+    start = datetime.strptime(days[0]["date"], '%Y-%m-%d').date()
+    end = datetime.strptime(days[-1]["date"], '%Y-%m-%d').date()
+    counts = [0] * ((end - start).days + 1)
+    for day in days:
+        offset = (datetime.strptime(day["date"], '%Y-%m-%d').date() - start).days
+        counts[offset] = int(day["count"])
+
+    if fmt == 'dense':
+        return {"format": "dense", "start": start.isoformat(), "counts": counts}
+
+    runs: List[List[int]] = []
+    for count in counts:
+        if runs and runs[-1][0] == count:
+            runs[-1][1] += 1
+        else:
+            runs.append([count, 1])
+    return {"format": "rle", "start": start.isoformat(), "runs": runs}
+
+def decode_contribution_days(encoded) -> List[Dict]:
+    """Inverse of encode_contribution_days: return the [{"date", "count"}, ...] list"""
+    if isinstance(encoded, list):
+        return encoded
+    if not encoded.get("start"):
+        return []
+
+    if encoded["format"] == 'rle':
+        counts = [count for count, length in encoded["runs"] for _ in range(length)]
+    else:
+        counts = encoded["counts"]
+
+    start = datetime.strptime(encoded["start"], '%Y-%m-%d').date()
+    return [{"date": (start + timedelta(days=i)).isoformat(), "count": c} for i, c in enumerate(counts)]
+
+def with_encoded_days(contribution_activity: Dict, fmt: str) -> Dict:
+    """Return contribution_activity with its `days` re-encoded in `fmt`"""
+    if fmt == 'list':
+        return contribution_activity
+    return {**contribution_activity, "days": encode_contribution_days(contribution_activity.get("days", []), fmt)}
+
+def fetch_repo_language_totals(username: str, repo: Dict, headers: Dict,
+                               errors: Optional[List[str]] = None) -> Dict[str, int]:
+    """Bytes per language for one repository, falling back to its primary language"""
+    primary = repo.get("language")
+    fallback = {primary: 1} if primary else {}
+    try:
+        resp = github_session().get(f"{GITHUB_API_BASE}/repos/{username}/{repo['name']}/languages", headers=headers, timeout=8)
+        if resp.status_code != 200:
+            # fallback: use repository.language as a single-language count
+            record_fallback(errors, f"language_distribution: {repo['name']} languages returned {resp.status_code}")
+            return fallback
+        return {lang: int(bytes_count) for lang, bytes_count in resp.json().items()}
+    except Exception as e:
+        record_fallback(errors, f"language_distribution: {repo['name']} languages failed: {e}")
+        return fallback
+
+def language_distribution_from_totals(lang_totals: Dict[str, int]) -> List[Dict]:
+    """Turn per-language byte totals into a sorted percentage distribution"""
+    total_bytes = sum(lang_totals.values()) or 1
+    distribution = [{"language": k, "percentage": round(v * 100.0 / total_bytes, 1)} for k, v in lang_totals.items()]
+    distribution.sort(key=lambda x: x["percentage"], reverse=True)
+    return distribution
+
+def aggregate_language_distribution(username: str, repositories: List[Dict],
+                                    errors: Optional[List[str]] = None) -> List[Dict]:
     """Aggregate language bytes across all repositories and return percentage distribution."""
     try:
         headers = {'Authorization': f'token {GITHUB_API_TOKEN}'} if GITHUB_API_TOKEN else {}
@@ -685,34 +977,382 @@ def aggregate_language_distribution(username: str, repositories: List[Dict]) ->
 
         # For each repo, call languages endpoint to get bytes per language
         for repo in repositories:
-            repo_name = repo.get("name")
-            if not repo_name:
-                continue
-            try:
-                resp = requests.get(f"{GITHUB_API_BASE}/repos/{username}/{repo_name}/languages", headers=headers, timeout=8)
-                if resp.status_code != 200:
-                    # fallback: use repository.language as a single-language count
-                    primary = repo.get("language")
-                    if primary:
-                        lang_totals[primary] = lang_totals.get(primary, 0) + 1
-                    continue
-                langs = resp.json()
-                for lang, bytes_count in langs.items():
-                    lang_totals[lang] = lang_totals.get(lang, 0) + int(bytes_count)
-            except Exception:
-                primary = repo.get("language")
-                if primary:
-                    lang_totals[primary] = lang_totals.get(primary, 0) + 1
+            if not repo.get("name"):
                 continue
+            for lang, bytes_count in fetch_repo_language_totals(username, repo, headers, errors=errors).items():
+                lang_totals[lang] = lang_totals.get(lang, 0) + bytes_count
 
-        total_bytes = sum(lang_totals.values()) or 1
-        distribution = [{"language": k, "percentage": round(v * 100.0 / total_bytes, 1)} for k, v in lang_totals.items()]
-        distribution.sort(key=lambda x: x["percentage"], reverse=True)
-        return distribution
+        return language_distribution_from_totals(lang_totals)
     except Exception as e:
         logger.error(f"Error aggregating languages for {username}: {e}")
+        record_fallback(errors, f"language_distribution: {e}")
         return []
 
+def parse_profile_args(args) -> Tuple[Tuple[str, ...], int]:
+    """
+    Parse `fields`/`include` and `repos_limit` query parameters.
+    Returns the requested sections (in pipeline order) and the repository cap.
+    Raises ValueError on unknown sections or a malformed limit.
+    """
+    raw_fields = args.get('fields') or args.get('include')
+    if raw_fields:
+        requested = {f.strip() for f in raw_fields.split(',') if f.strip()}
+        unknown = requested - set(PROFILE_SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        sections = tuple(s for s in PROFILE_SECTIONS if s in requested)
+    else:
+        sections = PROFILE_SECTIONS
+
+    raw_limit = args.get('repos_limit')
+    if raw_limit is None or raw_limit == '':
+        repos_limit = MAX_REPOSITORIES
+    else:
+        try:
+            repos_limit = int(raw_limit)
+        except ValueError:
+            raise ValueError("repos_limit must be an integer")
+        if repos_limit < 0:
+            raise ValueError("repos_limit must be non-negative")
+        repos_limit = min(repos_limit, MAX_REPOSITORIES)
+
+    return sections, repos_limit
+
+def parse_days_format(args) -> str:
+    """Parse the `days_format` query parameter (defaults to the plain list)"""
+    fmt = args.get('days_format') or 'list'
+    if fmt not in DAYS_FORMATS:
+        raise ValueError(f"days_format must be one of: {', '.join(DAYS_FORMATS)}")
+    return fmt
+
+def iter_github_profile(username: str, sections: Tuple[str, ...] = PROFILE_SECTIONS,
+                        repos_limit: int = MAX_REPOSITORIES,
+                        errors: Optional[List[str]] = None) -> Iterator[Tuple[str, object]]:
+    """
+    Run only the pipeline stages needed for the requested sections, yielding
+    (section, data) pairs as soon as each one is ready. Repositories are fetched
+    when either the repo list or the language distribution is requested, since
+    the language fan-out is per repository. Raises GitHubUserNotFound if the user
+    does not exist, even when the `user` section is not requested. Stages that fall
+    back after a failed GitHub call note it in `errors`.
+    """
+    fetch_repositories = bool(repos_limit) and ('repositories' in sections or 'language_distribution' in sections)
+
+    if 'user' in sections:
+        yield 'user', fetch_github_user_data(username)
+    elif not fetch_repositories:
+        # The repository fetch raises for unknown users; without it, check explicitly
+        # so a missing user is not reported as an empty profile
+        fetch_github_user_data(username)
+
+    repositories: List[Dict] = []
+    if fetch_repositories:
+        repositories = fetch_github_repositories(username, limit=repos_limit, errors=errors)
+    if 'repositories' in sections:
+        yield 'repositories', repositories
+
+    if 'contribution_activity' in sections:
+        yield 'contribution_activity', fetch_github_contributions(username, errors=errors)
+
+    if 'language_distribution' in sections:
+        yield 'language_distribution', aggregate_language_distribution(username, repositories, errors=errors)
+
+def collect_github_profile(username: str, sections: Tuple[str, ...] = PROFILE_SECTIONS,
+                           repos_limit: int = MAX_REPOSITORIES, errors: Optional[List[str]] = None) -> Dict:
+    """Run the profile pipeline to completion and return all requested sections"""
+    return dict(iter_github_profile(username, sections=sections, repos_limit=repos_limit, errors=errors))
+
+def format_stream_event(section: str, data, fmt: str) -> str:
+    """Serialize one profile section as an SSE event or an NDJSON line"""
+    if fmt == 'sse':
+        return f"event: {section}\ndata: {json.dumps(data)}\n\n"
+    return json.dumps({'section': section, 'data': data}) + "\n"
+
+def payload_etag(payload: bytes) -> str:
+    """Strong ETag derived from payload content"""
+    return hashlib.sha256(payload).hexdigest()[:32]
+
+def cache_control_header() -> str:
+    """Cache-Control value built from CACHE_MAX_AGE / CACHE_STALE_WHILE_REVALIDATE"""
+    if CACHE_MAX_AGE <= 0:
+        return 'no-cache'
+    value = f'public, max-age={CACHE_MAX_AGE}'
+    if CACHE_STALE_WHILE_REVALIDATE > 0:
+        value += f', stale-while-revalidate={CACHE_STALE_WHILE_REVALIDATE}'
+    return value
+
+def not_modified(etag: str) -> Optional[Response]:
+    """Return a 304 response if the request's If-None-Match matches `etag`, else None"""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control_header()
+    response.vary.add('Accept-Encoding')
+    return response
+
+def negotiate_encoding(size: int) -> Optional[str]:
+    """Pick br/gzip for bodies above COMPRESSION_MIN_SIZE, honouring Accept-Encoding"""
+    if size < COMPRESSION_MIN_SIZE:
+        return None
+    offered = ['br', 'gzip'] if brotli is not None else ['gzip']
+    return request.accept_encodings.best_match(offered)
+
+def cacheable_response(body: bytes, mimetype: str, etag: Optional[str] = None,
+                       compress: bool = True, headers: Optional[Dict] = None,
+                       cache: bool = True) -> Response:
+    """
+    Build a response with a strong ETag, Cache-Control and optional compression.
+    Each encoding gets its own ETag suffix so that representations never collide.
+    Answers 304 Not Modified when If-None-Match matches. With `cache=False` (a
+    result built from fallback data) it sends `no-store` and no ETag instead.
+    """
+    encoding = negotiate_encoding(len(body)) if compress else None
+    if cache:
+        etag = etag or payload_etag(body)
+        if encoding:
+            etag = f'{etag}-{encoding}'
+
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+
+    if encoding == 'br':
+        body = brotli.compress(body)
+    elif encoding == 'gzip':
+        body = gzip.compress(body, compresslevel=6)
+
+    response = Response(body, mimetype=mimetype, headers=headers)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if cache:
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = cache_control_header()
+    else:
+        response.headers['Cache-Control'] = 'no-store'
+    response.vary.add('Accept-Encoding')
+    return response
+
+# ==================== Comparison ====================
+
+COMPARE_USER_FIELDS = """
+      login
+      name
+      bio
+      avatarUrl
+      followers { totalCount }
+      following { totalCount }
+      publicRepos: repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+      repositories(first: $repos, privacy: PUBLIC, ownerAffiliations: OWNER, isFork: false,
+                   orderBy: {field: STARGAZERS, direction: DESC}) {
+        nodes {
+          name
+          description
+          url
+          stargazerCount
+          forkCount
+          primaryLanguage { name }
+          languages(first: 20, orderBy: {field: SIZE, direction: DESC}) {
+            edges { size node { name } }
+          }
+        }
+      }
+      contributionsCollection {
+        contributionCalendar {
+          totalContributions
+          weeks { contributionDays { date contributionCount } }
+        }
+      }
+"""
+
+def profile_from_graphql_user(node: Dict) -> Dict:
+    """Map a batched GraphQL user node onto the same shape as collect_github_profile"""
+    lang_totals: Dict[str, int] = {}
+    repositories = []
+    for repo in (node.get("repositories") or {}).get("nodes") or []:
+        repositories.append(repository_from_graphql(repo))
+        for edge in (repo.get("languages") or {}).get("edges") or []:
+            lang = edge["node"]["name"]
+            lang_totals[lang] = lang_totals.get(lang, 0) + int(edge.get("size", 0))
+
+    calendar = (node.get("contributionsCollection") or {}).get("contributionCalendar") or {}
+    days = [
+        {"date": d.get("date"), "count": d.get("contributionCount", 0)}
+        for w in calendar.get("weeks", []) for d in w.get("contributionDays", [])
+    ]
+
+    return {
+        'user': {
+            'login': node.get('login'),
+            'name': node.get('name'),
+            'bio': node.get('bio'),
+            'followers': (node.get('followers') or {}).get('totalCount'),
+            'following': (node.get('following') or {}).get('totalCount'),
+            'public_repos': (node.get('publicRepos') or {}).get('totalCount'),
+            'avatar_url': node.get('avatarUrl'),
+        },
+        'repositories': sorted(repositories, key=lambda x: x['stars'], reverse=True),
+        'contribution_activity': summarize_contribution_days(days, calendar.get("totalContributions", 0)),
+        'language_distribution': language_distribution_from_totals(lang_totals),
+    }
+
+def fetch_github_profiles_graphql(usernames: List[str], repos_limit: int) -> Dict[str, Dict]:
+    """
+    Fetch several full profiles with one aliased GraphQL query per batch.
+    Only profiles GraphQL returned are included. Users in failed batches, null
+    aliases (unknown users, but also organizations) and every user without a
+    token are left out, so the caller can fetch just those over REST.
+    """
+    if not GITHUB_API_TOKEN:
+        return {}
+
+    headers = {'Authorization': f'bearer {GITHUB_API_TOKEN}', 'Content-Type': 'application/json'}
+    profiles: Dict[str, Dict] = {}
+    for start in range(0, len(usernames), COMPARE_BATCH_SIZE):
+        batch = usernames[start:start + COMPARE_BATCH_SIZE]
+        params = ", ".join(f"$l{i}: String!" for i in range(len(batch)))
+        aliases = "\n".join(f"u{i}: user(login: $l{i}) {{{COMPARE_USER_FIELDS}}}" for i in range(len(batch)))
+        query = f"query($repos: Int!, {params}) {{\n{aliases}\n}}"
+        variables: Dict = {f"l{i}": name for i, name in enumerate(batch)}
+        variables["repos"] = repos_limit
+        try:
+            resp = github_session().post(GITHUB_GRAPHQL_URL, json={"query": query, "variables": variables}, headers=headers, timeout=20)
+            if resp.status_code != 200:
+                logger.warning(f"Batched GraphQL comparison fetch failed {resp.status_code}: {resp.text}")
+                continue
+            data = resp.json().get("data")
+        except Exception as e:
+            logger.warning(f"Batched GraphQL comparison fetch failed: {e}")
+            continue
+        if not data:
+            continue
+        for i, name in enumerate(batch):
+            node = data.get(f"u{i}")
+            if node:
+                profiles[name] = profile_from_graphql_user(node)
+    return profiles
+
+def fetch_github_profiles_rest(usernames: List[str], repos_limit: int,
+                               errors: Optional[List[str]] = None) -> Dict[str, Optional[Dict]]:
+    """
+    REST fallback for comparisons: user, repo and contribution fetches for every
+    user run on one shared pool, and the per-repo language fan-out shares a single
+    COMPARE_LANGUAGE_BUDGET of /languages calls across the whole set. Repositories
+    beyond the budget count towards their primary language only. Users that do
+    not exist map to None; users whose fetch failed map to {'error': ...}.
+    """
+    headers = {'Authorization': f'token {GITHUB_API_TOKEN}'} if GITHUB_API_TOKEN else {}
+
+    def fetch_base(name: str) -> Optional[Dict]:
+        try:
+            user = fetch_github_user_data(name)
+            repositories = fetch_github_repositories(name, limit=repos_limit, errors=errors) if repos_limit else []
+        except GitHubUserNotFound:
+            return None
+        except Exception as e:
+            record_fallback(errors, f"{name}: {e}")
+            return {'error': f"Failed to fetch GitHub user: {name}"}
+        return {
+            'user': user,
+            'repositories': repositories,
+            'contribution_activity': fetch_github_contributions(name, errors=errors),
+        }
+
+    with ThreadPoolExecutor(max_workers=COMPARE_WORKERS) as pool:
+        profiles = dict(zip(usernames, pool.map(fetch_base, usernames)))
+
+        # Hand out the language budget round-robin so every user gets a fair share
+        # of their most-starred repositories
+        queues = [[(name, repo) for repo in profile['repositories'] if repo.get('name')]
+                  for name, profile in profiles.items() if profile and 'error' not in profile]
+        budgeted = []
+        depth = 0
+        while len(budgeted) < COMPARE_LANGUAGE_BUDGET and any(depth < len(q) for q in queues):
+            for q in queues:
+                if depth < len(q) and len(budgeted) < COMPARE_LANGUAGE_BUDGET:
+                    budgeted.append(q[depth])
+            depth += 1
+        fetched = {
+            (name, repo['name']): totals
+            for (name, repo), totals in zip(
+                budgeted, pool.map(lambda item: fetch_repo_language_totals(item[0], item[1], headers, errors=errors), budgeted))
+        }
+
+    for name, profile in profiles.items():
+        if not profile or 'error' in profile:
+            continue
+        lang_totals: Dict[str, int] = {}
+        for repo in profile['repositories']:
+            totals = fetched.get((name, repo.get('name')))
+            if totals is None:
+                totals = {repo['language']: 1} if repo.get('language') else {}
+            for lang, bytes_count in totals.items():
+                lang_totals[lang] = lang_totals.get(lang, 0) + bytes_count
+        profile['language_distribution'] = language_distribution_from_totals(lang_totals)
+    return profiles
+
+def comparison_metrics(profile: Dict) -> Dict:
+    """Side-by-side metrics for one profile"""
+    repositories = profile['repositories']
+    activity = profile['contribution_activity']
+    distribution = profile['language_distribution']
+    return {
+        'login': profile['user'].get('login'),
+        'name': profile['user'].get('name'),
+        'avatar_url': profile['user'].get('avatar_url'),
+        'followers': profile['user'].get('followers'),
+        'public_repos': profile['user'].get('public_repos'),
+        'repo_count': len(repositories),
+        'total_stars': sum(repo.get('stars', 0) for repo in repositories),
+        'total_forks': sum(repo.get('forks', 0) for repo in repositories),
+        'top_language': distribution[0]['language'] if distribution else None,
+        'language_distribution': distribution,
+        'total_contributions': activity.get('total', 0),
+        'current_streak': activity.get('current_streak', 0),
+        'longest_streak': activity.get('longest_streak', 0),
+    }
+
+COMPARE_ALIGNED_METRICS = (
+    'followers', 'public_repos', 'repo_count', 'total_stars', 'total_forks',
+    'top_language', 'total_contributions', 'current_streak', 'longest_streak',
+)
+
+def compare_github_profiles(usernames: List[str], repos_limit: int = MAX_REPOSITORIES,
+                            errors: Optional[List[str]] = None) -> Dict:
+    """
+    Fetch every profile (batched GraphQL, with the shared-pool REST fallback for
+    users GraphQL could not fetch) and return per-user metrics plus metric and
+    language arrays aligned with `usernames`.
+    """
+    profiles = fetch_github_profiles_graphql(usernames, repos_limit)
+    missing = [name for name in usernames if name not in profiles]
+    if missing:
+        profiles.update(fetch_github_profiles_rest(missing, repos_limit, errors=errors))
+
+    users = []
+    for name in usernames:
+        profile = profiles.get(name)
+        if profile is None:
+            users.append({'login': name, 'error': f"GitHub user not found: {name}"})
+        elif 'error' in profile:
+            users.append({'login': name, 'error': profile['error']})
+        else:
+            users.append(comparison_metrics(profile))
+
+    metrics = {key: [u.get(key) for u in users] for key in COMPARE_ALIGNED_METRICS}
+
+    languages = sorted({d['language'] for u in users for d in u.get('language_distribution', [])})
+    language_mix = {
+        lang: [
+            next((d['percentage'] for d in u.get('language_distribution', []) if d['language'] == lang), 0.0)
+            if 'error' not in u else None
+            for u in users
+        ]
+        for lang in languages
+    }
+
+    return {'usernames': usernames, 'users': users, 'metrics': metrics, 'language_mix': language_mix}
+
 # ==================== API Endpoints ====================
 
 @app.route('/api/health', methods=['GET'])
@@ -720,6 +1360,15 @@ def health_check():
     """Health check endpoint"""
     return jsonify({'status': 'ok'})
 
+@app.route('/api/health/startup', methods=['GET'])
+def startup_metrics():
+    """Report module import time, lazily loaded dependency timings and uptime"""
+    return jsonify({
+        **STARTUP_TIMINGS,
+        'uptime_s': round(time.perf_counter() - _IMPORT_STARTED, 1),
+        'loaded_dependencies': [m for m in HEAVY_DEPENDENCIES if m in sys.modules],
+    })
+
 @app.route('/api/upload', methods=['POST'])
 def upload_resume():
     """Handle resume file upload and GitHub extraction"""
@@ -736,36 +1385,50 @@ def upload_resume():
             return jsonify({'error': 'Invalid file type. Use PDF, DOCX or TXT'}), 400
 
         filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(file_path)
-
         file_ext = filename.rsplit('.', 1)[1].lower()
-        text = ""
-        links: List[str] = []
-
-        if file_ext == 'pdf':
-            text, links = extract_text_and_links_from_pdf(file_path)
-        elif file_ext == 'docx':
-            text, links = extract_text_and_links_from_docx(file_path)
-        elif file_ext == 'txt':
-            text = extract_text_from_txt(file_path)
-            links = []
-        else:
-            os.remove(file_path)
+        if file_ext not in ALLOWED_EXTENSIONS:
             return jsonify({'error': 'Unsupported file type'}), 400
 
-        try:
-            os.remove(file_path)
-        except Exception:
-            logger.debug("Could not remove uploaded file")
+        # Identical uploads skip parsing (and GitHub validation once it has succeeded)
+        cache_key = resume_cache_key(file_ext, file.stream)
+        cached = resume_cache_get(cache_key)
+
+        if cached is not None:
+            github_username = cached['github_username']
+        else:
+            file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+            file.save(file_path)
+
+            text = ""
+            links: List[str] = []
 
-        github_username = extract_github_username(text, urls=links)
+            try:
+                if file_ext == 'pdf':
+                    text, links = extract_text_and_links_from_pdf(file_path)
+                elif file_ext == 'docx':
+                    text, links = extract_text_and_links_from_docx(file_path)
+                elif file_ext == 'txt':
+                    text = extract_text_from_txt(file_path)
+                    links = []
+            finally:
+                try:
+                    os.remove(file_path)
+                except Exception:
+                    logger.debug("Could not remove uploaded file")
+
+            github_username = extract_github_username(text, urls=links)
+            cached = {'github_username': github_username, 'valid': False}
+            resume_cache_put(cache_key, cached)
 
         if not github_username:
             return jsonify({'error': 'No GitHub profile found in resume'}), 404
 
-        if not validate_github_username(github_username):
-            return jsonify({'error': f'Invalid GitHub username: {github_username}'}), 404
+        # Only successful validations are cached: a False result may be a transient
+        # network error or rate limit rather than a missing user
+        if not cached['valid']:
+            if not validate_github_username(github_username):
+                return jsonify({'error': f'Invalid GitHub username: {github_username}'}), 404
+            resume_cache_put(cache_key, {'github_username': github_username, 'valid': True})
 
         return jsonify({'github_username': github_username}), 200
 
@@ -786,6 +1449,9 @@ def analyze_resume():
         
         if not text or not text.strip():
             return jsonify({'error': 'Resume text cannot be empty'}), 400
+
+        # Same bound as file uploads; profile links sit near the top of a resume
+        text = text[:MAX_EXTRACTED_CHARS]
         
         github_username = extract_github_username(text)
         
@@ -803,27 +1469,100 @@ def analyze_resume():
 
 @app.route('/api/github/<username>', methods=['GET'])
 def get_github_profile(username: str):
+    """Fetch GitHub profile data, optionally restricted via `fields`/`include` and `repos_limit`"""
     try:
         # basic validation
         if not re.match(r'^[A-Za-z0-9_-]+$', username):
             return jsonify({'error': 'Invalid GitHub username'}), 400
 
-        user_data = fetch_github_user_data(username)
-        repositories = fetch_github_repositories(username)
+        try:
+            sections, repos_limit = parse_profile_args(request.args)
+            days_format = parse_days_format(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
-        contribution_activity = fetch_github_contributions(username)
-        language_distribution = aggregate_language_distribution(username, repositories)
+        errors: List[str] = []
+        profile = collect_github_profile(username, sections=sections, repos_limit=repos_limit, errors=errors)
+        if 'contribution_activity' in profile:
+            profile['contribution_activity'] = with_encoded_days(profile['contribution_activity'], days_format)
 
-        return jsonify({
-            'user': user_data,
-            'repositories': repositories,
-            'contribution_activity': contribution_activity,
-            'language_distribution': language_distribution
-        }), 200
+        # Only a complete result is publicly cacheable
+        return cacheable_response(jsonify(profile).get_data(), mimetype='application/json', cache=not errors)
     except Exception as e:
         logger.error(f"Error in get_github_profile: {e}")
         return jsonify({'error': 'Failed to fetch GitHub profile'}), 500
 
+@app.route('/api/github/<username>/stream', methods=['GET'])
+def stream_github_profile(username: str):
+    """
+    Stream profile sections as they become available.
+    Emits NDJSON by default, or Server-Sent Events with `format=sse`
+    (or an `Accept: text/event-stream` header).
+    """
+    if not re.match(r'^[A-Za-z0-9_-]+$', username):
+        return jsonify({'error': 'Invalid GitHub username'}), 400
+
+    try:
+        sections, repos_limit = parse_profile_args(request.args)
+        days_format = parse_days_format(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    fmt = request.args.get('format')
+    if not fmt:
+        fmt = 'sse' if 'text/event-stream' in request.headers.get('Accept', '') else 'ndjson'
+    if fmt not in ('sse', 'ndjson'):
+        return jsonify({'error': 'format must be sse or ndjson'}), 400
+
+    def generate():
+        try:
+            for section, data in iter_github_profile(username, sections=sections, repos_limit=repos_limit):
+                if section == 'contribution_activity':
+                    data = with_encoded_days(data, days_format)
+                yield format_stream_event(section, data, fmt)
+        except Exception as e:
+            logger.error(f"Error in stream_github_profile: {e}")
+            yield format_stream_event('error', {'error': 'Failed to fetch GitHub profile'}, fmt)
+            return
+        yield format_stream_event('done', {}, fmt)
+
+    mimetype = 'text/event-stream' if fmt == 'sse' else 'application/x-ndjson'
+    return Response(generate(), mimetype=mimetype, headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+
+@app.route('/api/compare', methods=['GET'])
+def compare_github_users():
+    """Compare several GitHub users side by side (`usernames=a,b,c`)"""
+    try:
+        raw = request.args.get('usernames', '')
+        usernames: List[str] = []
+        for name in (n.strip() for n in raw.split(',')):
+            if name and name.lower() not in (u.lower() for u in usernames):
+                usernames.append(name)
+
+        if not usernames:
+            return jsonify({'error': 'No usernames provided'}), 400
+        if len(usernames) > COMPARE_MAX_USERS:
+            return jsonify({'error': f'At most {COMPARE_MAX_USERS} usernames can be compared'}), 400
+        invalid = [n for n in usernames if not re.match(r'^[A-Za-z0-9_-]+$', n)]
+        if invalid:
+            return jsonify({'error': f"Invalid GitHub username: {', '.join(invalid)}"}), 400
+
+        try:
+            _, repos_limit = parse_profile_args(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        errors: List[str] = []
+        comparison = compare_github_profiles(usernames, repos_limit=repos_limit, errors=errors)
+
+        return cacheable_response(jsonify(comparison).get_data(), mimetype='application/json', cache=not errors)
+    except Exception as e:
+        logger.error(f"Error in compare_github_users: {e}")
+        return jsonify({'error': 'Failed to compare GitHub profiles'}), 500
+
 @app.route('/api/github/<username>/export', methods=['GET'])
 def export_github_profile(username: str):
     """Export comprehensive PDF summary of GitHub profile matching dashboard layout"""
@@ -832,32 +1571,34 @@ def export_github_profile(username: str):
         if not re.match(r'^[A-Za-z0-9_-]+$', username):
             return jsonify({'error': 'Invalid GitHub username'}), 400
 
-        # Fetch user profile data
-        user_data = fetch_github_user_data(username)
-        
-        # Fetch repositories
-        repositories = fetch_github_repositories(username)
-        
-        # Fetch contribution activity (total, current streak, longest streak)
-        contribution_activity = fetch_github_contributions(username)
-        
-        # Fetch language distribution across all repositories
-        language_distribution = aggregate_language_distribution(username, repositories)
+        # Fetch user profile, repositories, contribution activity and language distribution
+        errors: List[str] = []
+        profile = collect_github_profile(username, errors=errors)
+
+        # The PDF embeds a generation timestamp, so tag it by its source data instead
+        etag = None
+        if not errors:
+            etag = payload_etag(b'pdf:' + json.dumps(profile, sort_keys=True).encode('utf-8'))
+            cached = not_modified(etag)
+            if cached is not None:
+                return cached
 
         # Generate comprehensive PDF with all dashboard features
         pdf_bytes = generate_pdf_summary(
-            user=user_data,
-            repositories=repositories,
-            contribution_activity=contribution_activity,
-            language_distribution=language_distribution
+            user=profile['user'],
+            repositories=profile['repositories'],
+            contribution_activity=profile['contribution_activity'],
+            language_distribution=profile['language_distribution']
         )
         
-        # Send PDF file as downloadable attachment
-        return send_file(
-            io.BytesIO(pdf_bytes),
+        # Send PDF file as downloadable attachment (already compressed, so no Content-Encoding)
+        return cacheable_response(
+            pdf_bytes,
             mimetype='application/pdf',
-            as_attachment=True,
-            download_name=f'{username}_github_profile.pdf'
+            etag=etag,
+            compress=False,
+            headers={'Content-Disposition': f'attachment; filename={username}_github_profile.pdf'},
+            cache=not errors
         )
         
     except ValueError as e:
@@ -877,6 +1618,12 @@ def not_found(error):
     """Handle 404 errors"""
     return jsonify({'error': 'Endpoint not found'}), 404
 
+STARTUP_TIMINGS['app_import_ms'] = round((time.perf_counter() - _IMPORT_STARTED) * 1000, 1)
+logger.info(f"App module imported in {STARTUP_TIMINGS['app_import_ms']} ms")
+
+if os.getenv('WARM_UP_ON_IMPORT') == '1':
+    warm_up_dependencies()
+
 # ==================== Main ====================
 
 if __name__ == '__main__':
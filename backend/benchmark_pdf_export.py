@@ -0,0 +1,89 @@
+"""
+Benchmark PDF export time as the repository count grows toward the 100-repo cap.
+
+Runs `generate_pdf_summary` on synthetic profiles (no network: no avatar URL),
+prints the median build time per repository count, and fits the marginal cost
+of one more repository. Export time is not flat: it grows linearly because the
+PDF itself grows. The check is that the slope stays under `--max-ms-per-repo`.
+The default bound is 1.5 ms, against roughly 2 ms per repository when each
+repository was built from styled Paragraphs. Exits non-zero if it is exceeded.
+
+    python benchmark_pdf_export.py [--runs 7] [--max-ms-per-repo 1.5]
+"""
+import argparse
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+from app import MAX_REPOSITORIES, generate_pdf_summary, warm_up_dependencies
+
+REPO_COUNTS = (0, 10, 25, 50, 75, MAX_REPOSITORIES)
+MAX_MS_PER_REPO = 1.5
+LANGUAGES = ('Python', 'TypeScript', 'Go', 'Rust', 'C++', 'Java', 'Shell', 'HTML', 'CSS', 'Ruby')
+
+
+def synthetic_profile(repo_count: int):
+    user = {
+        'login': 'octocat',
+        'name': 'The Octocat',
+        'bio': 'Benchmark profile',
+        'followers': 1000,
+        'following': 10,
+        'public_repos': repo_count,
+        'avatar_url': None,
+    }
+    repositories = [
+        {
+            'name': f'repository-{i}',
+            'description': f'Repository {i}: ' + 'a reasonably long description of what it does ' * 3,
+            'url': f'https://github.com/octocat/repository-{i}',
+            'stars': repo_count - i,
+            'forks': i % 17,
+            'language': LANGUAGES[i % len(LANGUAGES)],
+        }
+        for i in range(repo_count)
+    ]
+    start = date.today() - timedelta(days=370)
+    days = [{'date': (start + timedelta(days=i)).isoformat(), 'count': (i * 7) % 11 if i % 3 else 0} for i in range(371)]
+    contribution_activity = {'total': sum(d['count'] for d in days), 'current_streak': 2, 'longest_streak': 9, 'days': days}
+    language_distribution = [{'language': lang, 'percentage': round(40.0 / (i + 1), 1)} for i, lang in enumerate(LANGUAGES)]
+    return user, repositories, contribution_activity, language_distribution
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=7, help='timed runs per repository count')
+    parser.add_argument('--max-ms-per-repo', type=float, default=MAX_MS_PER_REPO,
+                        help='fail if one more repository costs more than this (fitted slope)')
+    args = parser.parse_args()
+
+    warm_up_dependencies()
+    medians = []
+    print(f"{'repos':>6}  {'median ms':>10}  {'pdf KiB':>8}")
+    for repo_count in REPO_COUNTS:
+        profile = synthetic_profile(repo_count)
+        generate_pdf_summary(*profile)  # untimed run fills the drawing caches
+        timings = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            pdf_bytes = generate_pdf_summary(*profile)
+            timings.append((time.perf_counter() - started) * 1000)
+        medians.append(statistics.median(timings))
+        print(f"{repo_count:>6}  {medians[-1]:>10.1f}  {len(pdf_bytes) / 1024:>8.1f}")
+
+    # Least-squares slope of median time over repository count
+    mean_count = statistics.mean(REPO_COUNTS)
+    mean_ms = statistics.mean(medians)
+    slope = (sum((c - mean_count) * (t - mean_ms) for c, t in zip(REPO_COUNTS, medians))
+             / sum((c - mean_count) ** 2 for c in REPO_COUNTS))
+    print(f"\nfixed cost ~{mean_ms - slope * mean_count:.1f} ms, "
+          f"{slope:.2f} ms per repository (limit {args.max_ms_per_repo} ms)")
+    if slope > args.max_ms_per_repo:
+        print("FAIL: per-repository export cost is above the limit")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
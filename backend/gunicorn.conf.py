@@ -0,0 +1,135 @@
+"""
+Gunicorn configuration for the GitTrackr API.
+
+Picked up automatically by `gunicorn app:app` when run from the backend directory.
+Every setting can be overridden with the environment variables below (or with the
+matching gunicorn CLI flag).
+
+    GUNICORN_WORKER_CLASS   sync | gthread (default) | gevent
+    WEB_CONCURRENCY         number of worker processes (default derived from usable
+                            cores; set it explicitly on small instances)
+    GUNICORN_THREADS        threads per gthread worker (default 4)
+    GUNICORN_PRELOAD        1 to import the app once in the master (default, except gevent)
+    WARM_UP_DEPENDENCIES    1 (default) to preload heavy dependencies before serving
+    PORT                    port to bind on 0.0.0.0 (default 5000)
+
+Graceful reload: `kill -HUP <master pid>` starts fresh workers and lets the old
+ones finish in-flight requests within `graceful_timeout`.
+"""
+import gc
+import math
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# ==================== Worker model ====================
+
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+
+
+def _usable_cores() -> int:
+    """
+    Cores this process can actually use: the CPU affinity mask, capped by the
+    container's CFS quota (cgroup v2 cpu.max, or the v1 cfs_quota_us/cfs_period_us
+    pair). cpu_count() alone reports every host core, even in a 0.5-CPU container.
+    """
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS
+        cores = multiprocessing.cpu_count()
+
+    quota = period = None
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()[:2]
+    except (OSError, ValueError):
+        try:
+            with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') as f:
+                quota = f.read().strip()
+            with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us') as f:
+                period = f.read().strip()
+        except OSError:
+            pass
+    try:
+        if quota not in (None, 'max', '-1'):
+            cores = min(cores, max(1, math.ceil(int(quota) / int(period))))
+    except (TypeError, ValueError, ZeroDivisionError):
+        pass
+    return cores
+
+
+_cores = _usable_cores()
+
+if worker_class == 'gthread':
+    # The API mostly waits on GitHub, so threads carry the concurrency
+    threads = int(os.getenv('GUNICORN_THREADS', '4'))
+    _default_workers = _cores
+elif worker_class == 'gevent':
+    # Requires `pip install gevent`
+    worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '1000'))
+    _default_workers = _cores
+else:
+    _default_workers = _cores * 2 + 1
+
+workers = int(os.getenv('WEB_CONCURRENCY', str(_default_workers)))
+
+# PDF exports and comparisons can take a while on large profiles
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = 5
+
+# Recycle workers periodically to bound memory growth; jitter avoids restarting all at once
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+accesslog = '-'
+errorlog = '-'
+
+# ==================== Preload / warm-up ====================
+
+# Import the app once in the master so workers share its pages copy-on-write.
+# gevent workers monkey-patch the stdlib only after fork, and anything the master
+# imports first (ssl via requests in particular) breaks under the patched sockets,
+# so gevent defaults to importing the app in each worker instead.
+preload_app = os.getenv('GUNICORN_PRELOAD', '0' if worker_class == 'gevent' else '1') == '1'
+
+# Preload heavy dependencies (requests, PyPDF2, python-docx, ReportLab) before
+# serving. With preload_app this happens once in the master (never for gevent);
+# otherwise in each worker once it has initialised, which for gevent is after
+# monkey-patching. Set WARM_UP_DEPENDENCIES=0 to keep them fully lazy.
+WARM_UP_DEPENDENCIES = os.getenv('WARM_UP_DEPENDENCIES', '1') == '1'
+_warm_up_in_master = preload_app and worker_class != 'gevent'
+
+
+def on_starting(server):
+    if not (WARM_UP_DEPENDENCIES and _warm_up_in_master):
+        return
+    from app import warm_up_dependencies
+
+    timings = warm_up_dependencies()
+    server.log.info(f"Master warmed up dependencies: {timings}")
+
+    # Move everything loaded so far into the permanent generation so the
+    # collector in each worker never writes to (and un-shares) those pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # Runs before the worker initialises (and before gevent patches), so only
+    # touch the app if the master already imported it
+    if not preload_app:
+        return
+    from app import reset_github_session
+
+    # Connection pools must never be shared across processes
+    reset_github_session()
+
+
+def post_worker_init(worker):
+    if not WARM_UP_DEPENDENCIES or _warm_up_in_master:
+        return
+    from app import warm_up_dependencies
+
+    timings = warm_up_dependencies()
+    worker.log.info(f"Worker {worker.pid} warmed up dependencies: {timings}")
@@ -0,0 +1,291 @@
+"""
+Pre-rendered drawing objects for the PDF export.
+
+Imported lazily by `generate_pdf_summary` (see `lazy_import` in app.py) so that
+only workers that actually export PDFs load it. Chart layouts (and the heatmap's
+PDF operators) are cached by their input data as immutable values. Each export
+wraps them in fresh flowables, so concurrent exports never share mutable state.
+Repository blocks lay out their text once at construction and draw with plain
+canvas calls, so export cost grows very little with repo count.
+"""
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import Flowable
+
+# Content width of the letter page with 40pt margins
+CONTENT_WIDTH = 6.5 * inch
+
+# Colors matching the dashboard
+INDIGO = colors.HexColor('#4f46e5')
+SLATE_500 = colors.HexColor('#64748b')
+SLATE_600 = colors.HexColor('#475569')
+SLATE_200 = colors.HexColor('#e2e8f0')
+SLATE_100 = colors.HexColor('#f1f5f9')
+
+LANGUAGE_COLORS = {
+    'JavaScript': '#f1e05a', 'TypeScript': '#3178c6', 'Python': '#3572A5', 'Java': '#b07219',
+    'Go': '#00ADD8', 'C': '#555555', 'C++': '#f34b7d', 'C#': '#178600', 'Ruby': '#701516',
+    'PHP': '#4F5D95', 'Rust': '#dea584', 'Kotlin': '#A97BFF', 'Swift': '#F05138',
+    'HTML': '#e34c26', 'CSS': '#563d7c', 'Shell': '#89e051', 'Jupyter Notebook': '#DA5B0B',
+    'Dart': '#00B4AB', 'Scala': '#c22d40', 'Vue': '#41b883',
+}
+FALLBACK_COLORS = ('#4f46e5', '#10b981', '#8b5cf6', '#f59e0b', '#ef4444', '#06b6d4', '#ec4899', '#84cc16')
+
+LANGUAGE_ROW_HEIGHT = 20
+LANGUAGE_LABEL_WIDTH = 1.4 * inch
+LANGUAGE_VALUE_WIDTH = 0.6 * inch
+
+# GitHub-style contribution levels, from no contributions to the busiest days
+HEATMAP_COLORS = ('#ebedf0', '#9be9a8', '#40c463', '#30a14e', '#216e39')
+HEATMAP_FILLS = tuple(colors.HexColor(c) for c in HEATMAP_COLORS)
+HEATMAP_LABEL_HEIGHT = 12
+HEATMAP_LEGEND_HEIGHT = 16
+
+
+def language_color(language: str, index: int) -> colors.Color:
+    """Dashboard color for a language, falling back to a fixed palette"""
+    return colors.HexColor(LANGUAGE_COLORS.get(language, FALLBACK_COLORS[index % len(FALLBACK_COLORS)]))
+
+
+@lru_cache(maxsize=128)
+def language_chart_layout(languages: Tuple[Tuple[str, float], ...], width: float = CONTENT_WIDTH):
+    """
+    Lay out a horizontal bar chart of (language, percentage) pairs, with bars scaled
+    to the largest percentage. Returns (height, rows) where each row is
+    (y, language, label, bar_width, color). Cached by input data.
+    """
+    top = max((pct for _, pct in languages), default=0) or 1
+    height = LANGUAGE_ROW_HEIGHT * len(languages) + 8
+    bar_area = width - LANGUAGE_LABEL_WIDTH - LANGUAGE_VALUE_WIDTH
+    rows = tuple(
+        (
+            height - (i + 1) * LANGUAGE_ROW_HEIGHT,
+            language,
+            f"{percentage}%",
+            max(percentage / top * bar_area, 1),
+            language_color(language, i),
+        )
+        for i, (language, percentage) in enumerate(languages)
+    )
+    return height, rows
+
+
+class LanguageBarChart(Flowable):
+    """Language distribution bars drawn from the cached language_chart_layout"""
+
+    def __init__(self, languages: Tuple[Tuple[str, float], ...], width: float = CONTENT_WIDTH):
+        super().__init__()
+        self.hAlign = 'CENTER'
+        self.width = width
+        self.height, self.rows = language_chart_layout(languages, width)
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        canvas = self.canv
+        bar_area = self.width - LANGUAGE_LABEL_WIDTH - LANGUAGE_VALUE_WIDTH
+        for y, language, label, bar_width, color in self.rows:
+            canvas.setFillColor(SLATE_600)
+            canvas.setFont('Helvetica-Bold', 9)
+            canvas.drawString(0, y + 6, language)
+            canvas.setFillColor(SLATE_100)
+            canvas.roundRect(LANGUAGE_LABEL_WIDTH, y + 3, bar_area, 12, 3, stroke=0, fill=1)
+            canvas.setFillColor(color)
+            canvas.roundRect(LANGUAGE_LABEL_WIDTH, y + 3, bar_width, 12, min(3, bar_width / 2), stroke=0, fill=1)
+            canvas.setFillColor(SLATE_500)
+            canvas.setFont('Helvetica', 9)
+            canvas.drawRightString(self.width, y + 6, label)
+
+
+def _fill_ops(color: colors.Color) -> str:
+    return f"{color.red:.3f} {color.green:.3f} {color.blue:.3f} rg"
+
+
+@lru_cache(maxsize=128)
+def contribution_heatmap_layout(start: str, counts: Tuple[int, ...], width: float = CONTENT_WIDTH):
+    """
+    Lay out a GitHub-style contribution calendar (one column per week, one row per
+    weekday, starting at `start`) and pre-render its cells as raw PDF operators.
+    Returns (height, cell_ops, month_labels, legend_x, cell). Cached by input data,
+    so repeat exports of the same profile skip the layout entirely.
+    """
+    start_date = datetime.strptime(start, '%Y-%m-%d').date()
+    # Calendar columns start on Sunday, like GitHub's
+    lead = (start_date.weekday() + 1) % 7
+    weeks = (lead + len(counts) + 6) // 7
+    pitch = width / max(weeks, 1)
+    cell = pitch * 0.82
+    grid_height = pitch * 7
+    height = HEATMAP_LABEL_HEIGHT + grid_height + HEATMAP_LEGEND_HEIGHT
+
+    peak = max(counts, default=0)
+    cells_by_level: List[List[str]] = [[] for _ in HEATMAP_FILLS]
+    month_labels: List[Tuple[float, str]] = []
+    last_month = None
+    for offset, count in enumerate(counts):
+        week, weekday = divmod(lead + offset, 7)
+        x = week * pitch
+        y = HEATMAP_LEGEND_HEIGHT + grid_height - (weekday + 1) * pitch
+        level = 0 if count <= 0 or peak <= 0 else min(4, 1 + (count * 4 - 1) // peak)
+        cells_by_level[level].append(f"{x:.2f} {y:.2f} {cell:.2f} {cell:.2f} re")
+
+        day = start_date + timedelta(days=offset)
+        if weekday == 0 and day.month != last_month:
+            # Skip labels that would run into the previous one or off the edge
+            if x + 20 < width and (not month_labels or x - month_labels[-1][0] >= 20):
+                month_labels.append((x, day.strftime('%b')))
+            last_month = day.month
+
+    # Legend: Less ■■■■■ More
+    legend_x = width - 5 * (cell + 2) - 28
+    for level in range(len(HEATMAP_FILLS)):
+        cells_by_level[level].append(f"{legend_x + level * (cell + 2):.2f} 2 {cell:.2f} {cell:.2f} re")
+
+    # One fill per level keeps the stream small: color, all its cells, then fill
+    ops = ["q"]
+    for level, rects in enumerate(cells_by_level):
+        ops.append(_fill_ops(HEATMAP_FILLS[level]))
+        ops.extend(rects)
+        ops.append("f")
+    ops.append("Q")
+    return height, "\n".join(ops), tuple(month_labels), legend_x, cell
+
+
+class ContributionHeatmap(Flowable):
+    """Contribution calendar drawn from the cached operators of contribution_heatmap_layout"""
+
+    def __init__(self, start: str, counts: Tuple[int, ...], width: float = CONTENT_WIDTH):
+        super().__init__()
+        self.hAlign = 'CENTER'
+        self.width = width
+        self.height, self.cell_ops, self.month_labels, self.legend_x, self.cell = \
+            contribution_heatmap_layout(start, counts, width)
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        canvas = self.canv
+        canvas.addLiteral(self.cell_ops)
+        canvas.setFont('Helvetica', 7)
+        canvas.setFillColor(SLATE_500)
+        label_y = self.height - HEATMAP_LABEL_HEIGHT + 3
+        for x, label in self.month_labels:
+            canvas.drawString(x, label_y, label)
+        canvas.drawRightString(self.legend_x - 4, 3, 'Less')
+        canvas.drawString(self.legend_x + 5 * (self.cell + 2) + 2, 3, 'More')
+
+
+def heatmap_for_days(days: List[Dict], width: float = CONTENT_WIDTH) -> Optional[ContributionHeatmap]:
+    """Heatmap flowable for a chronological [{date, count}] list (layout is cached)"""
+    if not days:
+        return None
+    start = datetime.strptime(days[0]['date'], '%Y-%m-%d').date()
+    end = datetime.strptime(days[-1]['date'], '%Y-%m-%d').date()
+    counts = [0] * ((end - start).days + 1)
+    for day in days:
+        counts[(datetime.strptime(day['date'], '%Y-%m-%d').date() - start).days] = int(day.get('count', 0))
+    return ContributionHeatmap(start.isoformat(), tuple(counts), width)
+
+
+def wrap_text(text: str, font_name: str, size: float, width: float) -> List[str]:
+    """
+    Split `text` into lines no wider than `width`: on whitespace first, then by
+    character for any word (a URL, say) that is wider than a whole line.
+    """
+    # Most names, metadata lines and URLs fit as they are
+    if '\n' not in text and stringWidth(text, font_name, size) <= width:
+        return [text]
+
+    lines: List[str] = []
+    for line in simpleSplit(text, font_name, size, width):
+        if stringWidth(line, font_name, size) <= width:
+            lines.append(line)
+            continue
+        start, used = 0, 0.0
+        for i, char in enumerate(line):
+            char_width = stringWidth(char, font_name, size)
+            if used + char_width > width and i > start:
+                lines.append(line[start:i])
+                start, used = i, 0.0
+            used += char_width
+        lines.append(line[start:])
+    return lines
+
+
+class RepositoryBlock(Flowable):
+    """
+    One repository entry (name, metadata, description, link, separator).
+
+    Lines are split once in __init__ and drawn with plain canvas calls, which
+    avoids the markup parsing and line breaking a Paragraph per field would
+    repeat for every repository.
+    """
+
+    NAME_FONT = ('Helvetica-Bold', 12, 15)  # font, size, leading
+    META_FONT = ('Helvetica', 9, 11)
+    BODY_FONT = ('Helvetica', 10, 14)
+    EMPTY_FONT = ('Helvetica-Oblique', 9, 11)
+    URL_FONT = ('Helvetica', 8, 10)
+
+    def __init__(self, index: int, repo: Dict, separator: bool = True, width: float = CONTENT_WIDTH):
+        super().__init__()
+        self.width = width
+        self.url = repo.get('url')
+        self.separator = separator
+
+        language = repo.get('language') or 'N/A'
+        self.lines: List[Tuple[Tuple[str, int, int], colors.Color, str, float, bool]] = []
+        self._add(self._wrap(f"{index}. {repo.get('name') or 'Unnamed'}", self.NAME_FONT), self.NAME_FONT, INDIGO, space_after=6)
+        self._add(self._wrap(f"⭐ {repo.get('stars', 0)} stars  •  🔱 {repo.get('forks', 0)} forks  •  💻 {language}",
+                             self.META_FONT), self.META_FONT, SLATE_500, space_after=4)
+        if repo.get('description'):
+            self._add(self._wrap(repo['description'], self.BODY_FONT), self.BODY_FONT, SLATE_600, space_after=6)
+        else:
+            self._add(["No description available"], self.EMPTY_FONT, SLATE_500, space_after=4)
+        if self.url:
+            # Each line of a wrapped URL gets its own link rectangle
+            self._add(self._wrap(self.url, self.URL_FONT), self.URL_FONT, INDIGO, space_after=8, link=True)
+
+        self.height = sum(font[2] + space for font, _, _, space, _ in self.lines)
+        if separator:
+            self.height += 16.5
+
+    def _wrap(self, text: str, font: Tuple[str, int, int]) -> List[str]:
+        font_name, size, _ = font
+        return wrap_text(text, font_name, size, self.width)
+
+    def _add(self, texts: List[str], font: Tuple[str, int, int], color: colors.Color,
+             space_after: float, link: bool = False) -> None:
+        for i, text in enumerate(texts):
+            self.lines.append((font, color, text, space_after if i == len(texts) - 1 else 0, link))
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        canvas = self.canv
+        y = self.height
+        for (font_name, size, leading), color, text, space_after, link in self.lines:
+            y -= leading
+            canvas.setFont(font_name, size)
+            canvas.setFillColor(color)
+            canvas.drawString(0, y + (leading - size) / 2, text)
+            if link:
+                text_width = canvas.stringWidth(text, font_name, size)
+                canvas.setStrokeColor(color)
+                canvas.setLineWidth(0.5)
+                canvas.line(0, y + 1, text_width, y + 1)
+                canvas.linkURL(self.url, (0, y, text_width, y + leading), relative=1)
+            y -= space_after
+        if self.separator:
+            canvas.setStrokeColor(SLATE_200)
+            canvas.setLineWidth(0.5)
+            canvas.line(0, 8, self.width, 8)